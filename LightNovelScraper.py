@@ -1,24 +1,66 @@
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from ebooklib import epub
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from collections import deque
 import logging
+import threading
 import time
 import re
-from typing import Optional, Tuple, List, Dict, TypedDict, Union
-from bs4.element import Comment
+import html
+from typing import Callable, Mapping, Optional, Tuple, List, Dict, TypedDict, Union
+from bs4.element import Comment, Tag
+import soupsieve
 import os
 from PIL import Image
 from io import BytesIO
 import platform
 import argparse
 from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import urlparse
 
 if  platform.system() == 'Windows':
     os.system('color')
 
+_CHAPTER_NUM_RE = re.compile(r'^(?:\d+\.?|chapter\s+\d+)$', re.IGNORECASE)
+_URL_CHAPTER_RE = re.compile(r'chapter-(\d+)')
+_AD_SELECTOR = soupsieve.compile(
+    'script, .CTGIiSmv, .L-MHncuP, .vm-placement, div[data-defid], div[data-mobid]'
+)
+_FOOTNOTE_PREFIXES = tuple(f"{i}." for i in range(1, 10))
+_STRONG_NOTE_KEYWORDS = frozenset({
+    'translator\'s note', 'translator note',
+    'chapter note', 't/n', 'note'
+})
+_START_NOTE_RE = re.compile(r'^(?:T/L|T/N):')
+_END_NOTE_RE = re.compile(
+    r't/n:|tn:|t/l:|tl:|'
+    r'translator(?:\'s)? note:|'
+    r'chapter note(?::| by)|'
+    r'thanks for playing|as always',
+    re.IGNORECASE
+)
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP-date) to seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 class ChapterData(TypedDict):
     title: str
     content: str
@@ -31,8 +73,25 @@ class ScraperConstants:
     MAX_RETRIES: int = 3
     MIN_CONTENT_LENGTH: int = 100
     DEFAULT_REQUESTS_PER_SECOND: float = 20.0
+    MIN_REQUESTS_PER_SECOND: float = 0.5
+    MAX_REQUESTS_PER_SECOND: float = 30.0
+    AIMD_INCREASE: float = 0.5
+    AIMD_DECREASE: float = 0.5
+    LATENCY_TARGET: float = 2.0
+    LATENCY_WINDOW: int = 10
+    POOL_CONNECTIONS: int = 4
+    POOL_MAXSIZE: int = 32
+    ASYNC_LIMIT_PER_HOST: int = 8
     MAX_COVER_HEIGHT: int = 2400
     COVER_ASPECT_RATIO: float = 2/3
+    COVER_RATIO_TOLERANCE: float = 1e-3
+    MAX_COVER_BYTES: int = 20 * 1024 * 1024
+    DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
+    PROGRESS_BAR_LENGTH: int = 50
+    PROGRESS_FLUSH_EVERY: int = 5
+    COVER_RESAMPLE: int = Image.Resampling.LANCZOS
+    COVER_FAST_RESAMPLE: int = Image.Resampling.BICUBIC
+    COVER_FAST_RESAMPLE_MAX_SCALE: float = 1.2
     USER_AGENT: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
 @dataclass
@@ -49,6 +108,22 @@ class Config:
         if not all(isinstance(getattr(cls, attr), bool) for attr in cls.__annotations__):
             raise ValueError("All configuration values must be boolean")
 
+class ChapterStrainer(SoupStrainer):
+    """Only builds the chapter title span and chapter container div while parsing."""
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Dict]) -> bool:
+        if not super().allow_tag_creation(nsprefix, name, attrs):
+            return False
+        attrs = attrs or {}
+        if name == 'div':
+            return attrs.get('id') == 'chapter-container'
+        classes = attrs.get('class') or []
+        if isinstance(classes, str):
+            classes = classes.split()
+        return 'chapter-title' in classes
+
+_CHAPTER_STRAINER = ChapterStrainer(['div', 'span'])
+
 class ConsoleColors:
     """ANSI color codes for console output."""
     RED: str = '\033[91m'
@@ -65,37 +140,75 @@ class ScraperError(Exception):
     pass
 
 class RateLimiter:
-    """Rate limiting implementation with exponential backoff."""
+    """Rate limiting implementation with AIMD backpressure."""
    
-    def __init__(self, requests_per_second: float = ScraperConstants.DEFAULT_REQUESTS_PER_SECOND):
+    def __init__(self, requests_per_second: float = ScraperConstants.DEFAULT_REQUESTS_PER_SECOND,
+                 min_rate: float = ScraperConstants.MIN_REQUESTS_PER_SECOND,
+                 max_rate: float = ScraperConstants.MAX_REQUESTS_PER_SECOND,
+                 alpha: float = ScraperConstants.AIMD_INCREASE,
+                 beta: float = ScraperConstants.AIMD_DECREASE,
+                 latency_target: float = ScraperConstants.LATENCY_TARGET):
         self.rate = requests_per_second
+        self.rate_min = min_rate
+        self.rate_max = max_rate
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target = latency_target
         self.min_interval = 1.0 / requests_per_second
-        self.last_request_times = deque(maxlen=10)
-        self.failed_attempts = 0
+        self.latencies = deque(maxlen=ScraperConstants.LATENCY_WINDOW)
+        # time.monotonic() timestamps: immune to wall clock jumps and allocation free
+        self._last = 0.0
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Claim the next request slot and return the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._last + self.min_interval, self.paused_until)
+            self._last = slot
+            return slot - now
        
     def wait(self) -> None:
-        """Wait appropriate time between requests with exponential backoff."""
-        now = datetime.now()
-        
-        if self.last_request_times:
-            elapsed = (now - self.last_request_times[-1]).total_seconds()
-            wait_time = max(0, self.min_interval - elapsed)
-        else:
-            wait_time = 0
-
-        if self.failed_attempts > 0:
-            wait_time += min(300, (2 ** self.failed_attempts) - 1)
-            
+        """Wait until the next request slot is due."""
+        wait_time = self.reserve()
         if wait_time > 0:
             time.sleep(wait_time)
-            
-        self.last_request_times.append(now)
+
+    def apply_headers(self, headers: Mapping[str, str]) -> None:
+        """Honor Retry-After and X-RateLimit-Remaining hints sent by the server."""
+        retry_after = _parse_retry_after(headers.get('Retry-After'))
+        remaining = headers.get('X-RateLimit-Remaining')
+        
+        with self._lock:
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            if remaining is not None and remaining.strip() == '0':
+                self._decrease_rate()
     
     def record_failure(self) -> None:
-        self.failed_attempts += 1
+        """Multiplicatively back off after a failed request."""
+        with self._lock:
+            self._decrease_rate()
     
-    def record_success(self) -> None:
-        self.failed_attempts = 0
+    def record_success(self, latency: Optional[float] = None) -> None:
+        """Additively speed up while the recent latency stays on target."""
+        with self._lock:
+            if latency is not None:
+                self.latencies.append(latency)
+                
+            if self.latencies and sum(self.latencies) / len(self.latencies) > self.latency_target:
+                # Only back off on a full window so one slow response can't halve the rate
+                if len(self.latencies) == self.latencies.maxlen:
+                    self._decrease_rate()
+                    self.latencies.clear()
+            else:
+                self.rate = min(self.rate_max, self.rate + self.alpha)
+                self.min_interval = 1.0 / self.rate
+
+    def _decrease_rate(self) -> None:
+        self.rate = max(self.rate_min, self.rate * self.beta)
+        self.min_interval = 1.0 / self.rate
 
 class ProgressTracker:
     def __init__(self, total: int):
@@ -103,6 +216,8 @@ class ProgressTracker:
         self.current = 0
         self.success = 0
         self.failures = 0
+        self._filled_length = -1
+        self._bar = ''
         
     def update(self, success: bool = True) -> None:
         self.current += 1
@@ -114,12 +229,16 @@ class ProgressTracker:
     
     def _display_progress(self) -> None:
         percent = (self.current / self.total) * 100
-        bar_length = 50
+        bar_length = ScraperConstants.PROGRESS_BAR_LENGTH
         filled_length = int(bar_length * self.current // self.total)
-        bar = '=' * filled_length + '-' * (bar_length - filled_length)
+        # The bar only changes bar_length times over a run, rebuild it only then
+        if filled_length != self._filled_length:
+            self._filled_length = filled_length
+            self._bar = '=' * filled_length + '-' * (bar_length - filled_length)
         
         stats = f"Success: {self.success} Failures: {self.failures}"
-        print(f'\rProgress |{bar}| {percent:.1f}% {stats}', end='', flush=True)
+        flush = self.current % ScraperConstants.PROGRESS_FLUSH_EVERY == 0 or self.current == self.total
+        print(f'\rProgress |{self._bar}| {percent:.1f}% {stats}', end='', flush=flush)
 
 class LightNovelScraper:
     def __init__(self, debug_mode: bool = False):
@@ -129,6 +248,14 @@ class LightNovelScraper:
         self.debug_mode = debug_mode
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        # Keep connections to the novel host alive across chapters; retries stay in get_chapter_content
+        adapter = HTTPAdapter(
+            pool_connections=ScraperConstants.POOL_CONNECTIONS,
+            pool_maxsize=ScraperConstants.POOL_MAXSIZE,
+            max_retries=Retry(total=0)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def _initialize_logging(self, debug_mode: bool) -> None:
         log_level = logging.DEBUG if debug_mode else logging.INFO
@@ -147,7 +274,7 @@ class LightNovelScraper:
             result = urlparse(url)
             return all([result.scheme, result.netloc])
         except Exception as e:
-            self.logger.error(f"URL validation failed: {str(e)}")
+            self.logger.error("URL validation failed: %s", e)
             return False
 
     def get_cover_image(self, image_url: str) -> Optional[Tuple[bytes, str, str]]:
@@ -155,10 +282,12 @@ class LightNovelScraper:
             raise ValidationError("Invalid cover image URL")
 
         try:
-            response = self.session.get(image_url, timeout=ScraperConstants.DEFAULT_TIMEOUT)
-            response.raise_for_status()
-            
-            image = Image.open(BytesIO(response.content))
+            image = Image.open(self._download_cover(image_url))
+            # Let libjpeg decode at a reduced DCT scale that still covers the final size (no-op for non-JPEG)
+            image.draft('RGB', (
+                int(ScraperConstants.MAX_COVER_HEIGHT * ScraperConstants.COVER_ASPECT_RATIO),
+                ScraperConstants.MAX_COVER_HEIGHT
+            ))
             if image.mode != 'RGB':
                 image = image.convert('RGB')
             
@@ -166,7 +295,8 @@ class LightNovelScraper:
             target_ratio = ScraperConstants.COVER_ASPECT_RATIO
             current_ratio = width/height
             
-            if current_ratio != target_ratio:
+            # Covers already at 2:3 (within rounding) skip the crop copy entirely
+            if abs(current_ratio - target_ratio) > ScraperConstants.COVER_RATIO_TOLERANCE:
                 if current_ratio > target_ratio:
                     new_width = int(height * target_ratio)
                     left = (width - new_width) // 2
@@ -175,70 +305,103 @@ class LightNovelScraper:
                     new_height = int(width / target_ratio)
                     top = (height - new_height) // 2
                     image = image.crop((0, top, width, top + new_height))
+                width, height = image.size
             
             if height > ScraperConstants.MAX_COVER_HEIGHT:
                 new_height = ScraperConstants.MAX_COVER_HEIGHT
                 new_width = int(new_height * target_ratio)
-                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                scale = height / new_height
+                if scale >= 2.0:
+                    # Box-filter by the integer factor first so Lanczos only handles the remainder
+                    image = image.reduce(int(scale))
+                if 1.0 < scale < ScraperConstants.COVER_FAST_RESAMPLE_MAX_SCALE:
+                    resample = ScraperConstants.COVER_FAST_RESAMPLE
+                else:
+                    resample = ScraperConstants.COVER_RESAMPLE
+                image = image.resize((new_width, new_height), resample)
             
             img_byte_arr = BytesIO()
             image.save(img_byte_arr, format='JPEG', quality=95)
             return img_byte_arr.getvalue(), 'image/jpeg', 'cover.jpg'
             
         except Exception as e:
-            self.logger.error(f"Cover image processing failed: {str(e)}")
+            self.logger.error("Cover image processing failed: %s", e)
             return None
 
+    def _download_cover(self, image_url: str) -> BytesIO:
+        """Stream the cover image into memory, refusing anything over MAX_COVER_BYTES."""
+        with self.session.get(image_url, timeout=ScraperConstants.DEFAULT_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            
+            content_length = response.headers.get('Content-Length')
+            if content_length and content_length.isdigit() and int(content_length) > ScraperConstants.MAX_COVER_BYTES:
+                raise ScraperError(f"Cover image too large: {content_length} bytes")
+            
+            buffer = BytesIO()
+            for chunk in response.iter_content(chunk_size=ScraperConstants.DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
+                if buffer.tell() > ScraperConstants.MAX_COVER_BYTES:
+                    raise ScraperError("Cover image exceeds the maximum allowed size")
+        
+        buffer.seek(0)
+        return buffer
+
     def _clean_html_content(self, content_div: BeautifulSoup) -> BeautifulSoup:
         """Clean HTML content while preserving main content."""
-        # Remove SSE comments and ad-related elements first
-        content_str = str(content_div)
-        content_str = re.sub(r'<!--sse-->.*?<!--/sse-->', '', content_str, flags=re.DOTALL)
-        
-        # Parse cleaned content back to BeautifulSoup
-        content_div = BeautifulSoup(content_str, 'html.parser')
+        # Remove SSE comment blocks in place, everything from <!--sse--> up to <!--/sse-->
+        sse_markers = content_div.find_all(string=lambda s: isinstance(s, Comment) and s.strip() == 'sse')
+        for marker in sse_markers:
+            # Walk in document order, the closing marker may sit at a different nesting level
+            block = []
+            end = None
+            for node in marker.next_elements:
+                if isinstance(node, Comment) and node.strip() == '/sse':
+                    end = node
+                    break
+                block.append(node)
+            if end is None:
+                # No closing marker, drop only the marker rather than the rest of the chapter
+                marker.extract()
+                continue
+            # Ancestors of the closing marker are still open there, so only part of them is inside the block
+            inside = {id(node) for node in block} - {id(node) for node in end.parents}
+            for node in block:
+                if id(node) in inside and id(node.parent) not in inside:
+                    node.extract()
+            marker.extract()
+            end.extract()
         
         # Remove specific ad-related elements
-        for selector in [
-            'script', '.CTGIiSmv', '.L-MHncuP', '.vm-placement', 
-            'div[data-defid]', 'div[data-mobid]'
-        ]:
-            for element in content_div.select(selector):
-                element.decompose()
+        for element in _AD_SELECTOR.select(content_div):
+            element.decompose()
         
         return content_div
 
-    def _is_chapter_number(self, text: str) -> bool:
-        text = text.strip()
-        patterns = [
-            r'^\d+$',
-            r'^chapter\s+\d+$',
-            r'^\d+\.?$'
-        ]
-        return any(re.match(pattern, text.lower()) for pattern in patterns)
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _is_chapter_number(text: str) -> bool:
+        return _CHAPTER_NUM_RE.match(text.strip()) is not None
 
     def _is_note_or_message(self, text: str, p_element: BeautifulSoup) -> bool:
         """Check if text or element content matches note patterns."""
-        # First check strong/b elements combined with following text
-        strong_elements = p_element.find_all(['strong', 'b'])
-        for strong in strong_elements:
+        # Cached text check first, strong/b elements only if that misses
+        return self._text_is_note(text) or self._strong_is_note(p_element)
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _text_is_note(text: str) -> bool:
+        """Check paragraph text against the end note patterns; repeated note lines hit the cache."""
+        return _END_NOTE_RE.search(text) is not None
+
+    def _strong_is_note(self, p_element: BeautifulSoup) -> bool:
+        """Check if any strong/b element inside the paragraph reads like a note heading."""
+        for strong in p_element.find_all(['strong', 'b']):
             strong_text = strong.text.strip().lower()
-            if any(note_type in strong_text for note_type in [
-                'translator\'s note', 'translator note',
-                'chapter note', 't/n', 'note'
-            ]):
+            if any(note_type in strong_text for note_type in _STRONG_NOTE_KEYWORDS):
                 return True
+        return False
 
-        # Then check regular text patterns
-        text_lower = text.lower()
-        return any(pattern in text_lower for pattern in [
-            't/n:', 'tn:', 't/l:', 'tl:',
-            'translator\'s note:', 'translator note:',
-            'chapter note:', 'chapter note by',
-            'thanks for playing', 'as always'
-        ])
-
-    def _process_content(self, content_div: BeautifulSoup) -> Tuple[List[str], List[str], Dict[str, str], List[str]]:
+    def _process_content(self, content_div: BeautifulSoup) -> Tuple[List[Tag], List[Tag], Dict[str, str], List[str]]:
         """Process and extract content components."""
         content_div = self._clean_html_content(content_div)
         
@@ -248,8 +411,10 @@ class LightNovelScraper:
         debug_notes = []
         found_separator = False
         in_main_content = True
+        # Looked up once instead of per paragraph
+        _debug = self.debug_mode
         
-        if self.debug_mode:
+        if _debug:
             print("\nRaw content before processing:")
             print(content_div.prettify())
         
@@ -258,39 +423,37 @@ class LightNovelScraper:
             if not text:
                 continue
 
-            if self.debug_mode:
+            if _debug:
                 print(f"\nProcessing paragraph: {text[:100]}...")
 
             # Always add to main content unless it's clearly a note
-            if text.startswith('T/L:') or text.startswith('T/N:'):
+            if _START_NOTE_RE.match(text):
                 if Config.INCLUDE_CHAPTER_NOTES:
-                    after_separator.append(str(p))
-                debug_notes.append(f"Start note: {str(p)}")
-                if self.debug_mode:
+                    after_separator.append(p)
+                if _debug:
+                    debug_notes.append(f"Start note: {str(p)}")
                     print("Found start note")
-            elif text.startswith(tuple(str(i) + '.' for i in range(1, 10))) and ':' in text:
+            elif text.startswith(_FOOTNOTE_PREFIXES) and ':' in text:
                 if Config.INCLUDE_FOOTNOTES:
                     footnotes[text.split('.')[0]] = text
-                debug_notes.append(f"Footnote: {text}")
-                if self.debug_mode:
+                if _debug:
+                    debug_notes.append(f"Footnote: {text}")
                     print("Found footnote")
-            elif ('T/N:' in text or 'Chapter Note:' in text or 
-                'Thanks for playing' in text or 'As always' in text or
-                self._is_note_or_message(text, p)):
+            elif self._is_note_or_message(text, p):
                 found_separator = True
                 if Config.INCLUDE_CHAPTER_NOTES:
-                    after_separator.append(str(p))
-                debug_notes.append(f"End note: {str(p)}")
-                if self.debug_mode:
+                    after_separator.append(p)
+                if _debug:
+                    debug_notes.append(f"End note: {str(p)}")
                     print("Found end note")
             else:
                 # Add to main content if it's not obviously a note
                 if not self._is_chapter_number(text):
-                    paragraphs.append(str(p))
-                    if self.debug_mode:
+                    paragraphs.append(p)
+                    if _debug:
                         print("Added to main content")
 
-        if self.debug_mode:
+        if _debug:
             print(f"\nProcessing results:")
             print(f"Main paragraphs: {len(paragraphs)}")
             print(f"After separator: {len(after_separator)}")
@@ -313,85 +476,157 @@ class LightNovelScraper:
             try:
                 self.rate_limiter.wait()
                 
-                response = self.session.get(url, timeout=ScraperConstants.DEFAULT_TIMEOUT)
+                started = time.monotonic()
+                response = self.session.get(url, timeout=ScraperConstants.DEFAULT_TIMEOUT, stream=False)
+                latency = time.monotonic() - started
+                self.rate_limiter.apply_headers(response.headers)
                 response.raise_for_status()
                 
-                if not response.text.strip():
-                    raise ValueError("Empty response received")
-                
-                # First parse the full HTML
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                title_elem = soup.find('span', class_='chapter-title')
-                chapter_title = self._process_chapter_title(title_elem, url)
-                
-                if not chapter_title:
-                    raise ValueError("Chapter title not found")
+                chapter = self._parse_chapter_page(response.content, response.encoding, url)
+                self.rate_limiter.record_success(latency)
+                return chapter
 
-                # Find the chapter container and process its content
-                content_div = soup.find('div', id='chapter-container')
-                if not content_div:
-                    raise ValueError("Content container not found")
-
-                if self.debug_mode:
-                    print(f"\nProcessing chapter: {chapter_title}")
-                    print(f"URL: {url}")
+            except Exception as e:
+                # %-style arguments are only formatted if the record is actually emitted
+                self.logger.error("Attempt %d failed for %s: %s", attempt + 1, url, e)
+                if self.debug_mode and self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Traceback for %s", url, exc_info=True)
+                self.rate_limiter.record_failure()
+                if attempt < ScraperConstants.MAX_RETRIES - 1:
+                    time.sleep((attempt + 1) * 5)
+                else:
+                    return None, None, None, None
 
-                paragraphs, after_separator, footnotes, debug_notes = self._process_content(content_div)
+        return None, None, None, None
 
-                if len(paragraphs) == 0:
-                    if self.debug_mode:
-                        print("\nNo paragraphs found in content. Raw content:")
-                        print(content_div.prettify())
-                    raise ValueError("No valid content found")
+    def fetch_chapters(self, chapter_urls: Dict[int, str],
+                       on_chapter: Optional[Callable[[int, Tuple], None]] = None) -> Dict[int, Tuple]:
+        """Fetch all chapters concurrently, keyed by chapter number."""
+        for url in chapter_urls.values():
+            if not self.validate_url(url):
+                raise ValidationError("Invalid chapter URL")
+        return asyncio.run(self._fetch_chapters(chapter_urls, on_chapter))
+
+    async def _fetch_chapters(self, chapter_urls: Dict[int, str],
+                              on_chapter: Optional[Callable[[int, Tuple], None]]) -> Dict[int, Tuple]:
+        limiter = AsyncLimiter(ScraperConstants.MAX_REQUESTS_PER_SECOND, 1)
+        connector = aiohttp.TCPConnector(limit_per_host=ScraperConstants.ASYNC_LIMIT_PER_HOST)
+        timeout = aiohttp.ClientTimeout(total=ScraperConstants.DEFAULT_TIMEOUT)
+        results = {}
+
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout) as session:
+            async def fetch(chapter_num: int, url: str) -> Tuple[int, Tuple]:
+                return chapter_num, await self._fetch_chapter(session, limiter, url)
+
+            tasks = [fetch(chapter_num, url) for chapter_num, url in chapter_urls.items()]
+            for next_done in asyncio.as_completed(tasks):
+                chapter_num, chapter = await next_done
+                results[chapter_num] = chapter
+                if on_chapter:
+                    on_chapter(chapter_num, chapter)
+
+        return results
+
+    async def _fetch_chapter(self, session: aiohttp.ClientSession, limiter: AsyncLimiter,
+                             url: str) -> Tuple[Optional[str], Optional[str], Optional[List[str]], Optional[dict]]:
+        """Async counterpart of get_chapter_content; parsing runs off the event loop."""
+        loop = asyncio.get_running_loop()
 
-                content = self._format_chapter_content(paragraphs, footnotes)
-                
-                if self.debug_mode and debug_notes:
-                    print(f"\n{ConsoleColors.RED}Excluded notes for {chapter_title}:")
-                    for note in debug_notes:
-                        print(f"Note: {note}{ConsoleColors.RESET}")
-                
-                self.rate_limiter.record_success()
-                return chapter_title, content, after_separator, footnotes
+        for attempt in range(ScraperConstants.MAX_RETRIES):
+            try:
+                # The AsyncLimiter is the hard ceiling, the adaptive RateLimiter paces within it
+                async with limiter:
+                    await asyncio.sleep(self.rate_limiter.reserve())
+                    started = time.monotonic()
+                    async with session.get(url) as response:
+                        self.rate_limiter.apply_headers(response.headers)
+                        response.raise_for_status()
+                        body = await response.read()
+                        encoding = response.charset
+                    latency = time.monotonic() - started
+
+                chapter = await loop.run_in_executor(None, self._parse_chapter_page, body, encoding, url)
+                self.rate_limiter.record_success(latency)
+                return chapter
 
             except Exception as e:
-                self.logger.error(f"Attempt {attempt + 1} failed for {url}: {str(e)}")
-                if self.debug_mode:
-                    import traceback
-                    self.logger.error(traceback.format_exc())
+                self.logger.error("Attempt %d failed for %s: %s", attempt + 1, url, e)
+                if self.debug_mode and self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Traceback for %s", url, exc_info=True)
                 self.rate_limiter.record_failure()
                 if attempt < ScraperConstants.MAX_RETRIES - 1:
-                    time.sleep((attempt + 1) * 5)
-                else:
-                    return None, None, None, None
+                    await asyncio.sleep((attempt + 1) * 5)
 
         return None, None, None, None
 
+    def _parse_chapter_page(self, body: bytes, encoding: Optional[str], url: str) -> Tuple[str, str, List[str], Dict[str, str]]:
+        """Parse a fetched chapter page into title, content, notes and footnotes."""
+        if not body.strip():
+            raise ValueError("Empty response received")
+        
+        # Parse only the title and chapter container; handing lxml the raw bytes
+        # with the declared encoding skips a Python-side decode and charset sniffing
+        soup = BeautifulSoup(
+            body, 'lxml',
+            from_encoding=encoding,
+            parse_only=_CHAPTER_STRAINER
+        )
+        
+        title_elem = soup.find('span', class_='chapter-title')
+        chapter_title = self._process_chapter_title(title_elem, url)
+        
+        if not chapter_title:
+            raise ValueError("Chapter title not found")
+
+        # Find the chapter container and process its content
+        content_div = soup.find('div', id='chapter-container')
+        if not content_div:
+            raise ValueError("Content container not found")
+
+        if self.debug_mode:
+            print(f"\nProcessing chapter: {chapter_title}")
+            print(f"URL: {url}")
+
+        paragraphs, after_separator, footnotes, debug_notes = self._process_content(content_div)
+
+        if len(paragraphs) == 0:
+            if self.debug_mode:
+                print("\nNo paragraphs found in content. Raw content:")
+                print(content_div.prettify())
+            raise ValueError("No valid content found")
+
+        content = self._format_chapter_content(paragraphs, footnotes)
+        
+        if self.debug_mode and debug_notes:
+            print(f"\n{ConsoleColors.RED}Excluded notes for {chapter_title}:")
+            for note in debug_notes:
+                print(f"Note: {note}{ConsoleColors.RESET}")
+        
+        # Serialize the notes here so the chapter result doesn't keep the page tree alive
+        notes = [str(note) for note in after_separator]
+        return chapter_title, content, notes, footnotes
+
     def _process_chapter_title(self, title_elem: Optional[BeautifulSoup], url: str) -> Optional[str]:
         if not title_elem:
             return None
             
         if Config.SIMPLE_CHAPTER_NAMES:
-            url_match = re.search(r'chapter-(\d+)', url)
+            url_match = _URL_CHAPTER_RE.search(url)
             return f"Chapter {url_match.group(1)}" if url_match else title_elem.text.strip()
         return title_elem.text.strip()
 
-    def _format_chapter_content(self, paragraphs: List[str], footnotes: Dict[str, str]) -> str:
-        processed_paragraphs = []
+    def _format_chapter_content(self, paragraphs: List[Tag], footnotes: Dict[str, str]) -> str:
+        # Footnote references are linked or dropped in place, then everything is serialized once
         for p in paragraphs:
-            if Config.INCLUDE_FOOTNOTES:
-                soup_p = BeautifulSoup(p, 'html.parser')
-                for sup in soup_p.find_all('sup'):
-                    ref_num = sup.text.strip()
-                    if ref_num in footnotes:
-                        sup.wrap(soup_p.new_tag('a', href=f'#footnote-{ref_num}'))
-                processed_paragraphs.append(str(soup_p))
-            else:
-                p_clean = re.sub(r'<sup>.*?</sup>', '', p)
-                processed_paragraphs.append(p_clean)
+            for sup in p.find_all('sup'):
+                if not Config.INCLUDE_FOOTNOTES:
+                    sup.decompose()
+                    continue
+                ref_num = sup.text.strip()
+                if ref_num in footnotes:
+                    sup.wrap(Tag(name='a', attrs={'href': f'#footnote-{ref_num}'}))
         
-        return "\n".join(processed_paragraphs)
+        return "\n".join(str(p) for p in paragraphs)
 
 class EpubCreator:
     def __init__(self, novel_title: str, author: str = "Unknown", 
@@ -426,10 +661,11 @@ class EpubCreator:
             lang='en'
         )
         
+        # Assembled as UTF-8 bytes so EbookLib doesn't re-encode the joined chapter
         chapter_content = [
-            f'<h1>{chapter_data["title"]}</h1>',
-            '<div class="chapter-content">',
-            chapter_data['content']
+            f'<h1>{html.escape(chapter_data["title"])}</h1>'.encode('utf-8'),
+            b'<div class="chapter-content">',
+            chapter_data['content'].encode('utf-8')
         ]
 
         if Config.INCLUDE_FOOTNOTES and chapter_data['footnotes']:
@@ -438,31 +674,28 @@ class EpubCreator:
         if Config.INCLUDE_CHAPTER_NOTES and chapter_data['notes']:
             chapter_content.extend(self._format_chapter_notes(chapter_data['notes']))
             
-        chapter_content.append('</div>')
-        chapter.content = '\n'.join(chapter_content)
+        chapter_content.append(b'</div>')
+        chapter.content = b'\n'.join(chapter_content)
         
         self.book.add_item(chapter)
         return chapter
 
-    def _format_footnotes(self, footnotes: Dict[str, str]) -> List[str]:
-        return [
-            '<div class="footnotes">',
-            '<hr/>',
-            '<h3>Footnotes</h3>',
-            *[f'<p id="footnote-{num}" class="footnote"><sup>{num}</sup> {text} '
-                f'<a href="#ref-{num}">↩</a></p>'
-                for num, text in footnotes.items()],
-            '</div>'
-        ]
-
-    def _format_chapter_notes(self, notes: List[str]) -> List[str]:
-        return [
-            '<div class="chapter-notes">',
-            '<hr/>',
-            '<h3>Chapter Notes</h3>',
-            *notes,
-            '</div>'
-        ]
+    def _format_footnotes(self, footnotes: Dict[str, str]) -> List[bytes]:
+        formatted = [b''] * (len(footnotes) + 4)
+        formatted[0] = b'<div class="footnotes">'
+        formatted[1] = b'<hr/>'
+        formatted[2] = b'<h3>Footnotes</h3>'
+        for i, (num, text) in enumerate(footnotes.items(), 3):
+            formatted[i] = (f'<p id="footnote-{num}" class="footnote"><sup>{num}</sup> {html.escape(text)} '
+                            f'<a href="#ref-{num}">↩</a></p>').encode('utf-8')
+        formatted[-1] = b'</div>'
+        return formatted
+
+    def _format_chapter_notes(self, notes: List[str]) -> List[bytes]:
+        formatted = [b'<div class="chapter-notes">', b'<hr/>', b'<h3>Chapter Notes</h3>']
+        formatted.extend(note.encode('utf-8') for note in notes)
+        formatted.append(b'</div>')
+        return formatted
 
     def finalize(self, chapters: List[epub.EpubHtml]) -> None:
         self._add_navigation(chapters)
@@ -684,7 +917,6 @@ def main() -> None:
         scraper = LightNovelScraper(debug_mode=Config.DEBUG_MODE)
         progress = ProgressTracker(inputs['end_chapter'] - inputs['start_chapter'] + 1)
         
-        chapters_data = []
         epub_creator = EpubCreator(
             inputs['novel_title'],
             author=inputs['author'],
@@ -699,23 +931,33 @@ def main() -> None:
             else:
                 print(f"\n{ConsoleColors.YELLOW}Warning: Failed to process cover image{ConsoleColors.RESET}")
 
-        for chapter_num in range(inputs['start_chapter'], inputs['end_chapter'] + 1):
-            url = f"{inputs['base_url']}{inputs['novel_id']}/chapter-{chapter_num}"
-            
-            chapter_title, content, notes, footnotes = scraper.get_chapter_content(url)
-            
+        # Chapters are fetched concurrently; the rate limiters still pace the requests
+        scraped_chapters = {}
+
+        def record_chapter(chapter_num: int, chapter: Tuple) -> None:
+            chapter_title, content, notes, footnotes = chapter
             if chapter_title and content:
-                chapters_data.append({
+                scraped_chapters[chapter_num] = {
                     'title': chapter_title,
                     'content': content,
                     'notes': notes or [],
                     'footnotes': footnotes or {}
-                })
+                }
                 progress.update(True)
             else:
                 progress.update(False)
                 print(f"\n{ConsoleColors.YELLOW}Warning: Failed to process chapter {chapter_num}{ConsoleColors.RESET}")
 
+        chapter_url_prefix = f"{inputs['base_url']}{inputs['novel_id']}/chapter-"
+        chapter_urls = {
+            chapter_num: chapter_url_prefix + str(chapter_num)
+            for chapter_num in range(inputs['start_chapter'], inputs['end_chapter'] + 1)
+        }
+        scraper.fetch_chapters(chapter_urls, on_chapter=record_chapter)
+
+        # Restore reading order, chapters finish out of order
+        chapters_data = [scraped_chapters[num] for num in sorted(scraped_chapters)]
+
         if chapters_data:
             epub_chapters = []
             for idx, chapter_data in enumerate(chapters_data, 1):
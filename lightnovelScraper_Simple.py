@@ -1,271 +1,462 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from selectolax.lexbor import LexborHTMLParser
 import ebooklib
 from ebooklib import epub
-from datetime import datetime
-from collections import deque
 import logging
 import sys
-import time
 import re
-from typing import Optional, Tuple, List
-from bs4.element import Comment
+import time
+import gzip
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple, List
 import os
 
+_CHAPTER_NUM_RE = re.compile(r'chapter-(\d+)')
+NOT_FOUND = 'NOT_FOUND'  # Footnotes slot of a chapter result when the page returned 404
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_AD_TAGS = frozenset({'script', 'ins', 'iframe'})
+_AD_CLASSES = frozenset({'adsbox', 'ads', 'ad-container', 'aoyveLDZ', 'vm-placement'})
+
+# Encoded once at import, EbookLib writes bytes content as is
+_NAV_CSS_BYTES = """
+body {
+    font-family: Times New Roman, serif;
+    margin: 5%;
+    text-align: justify;
+}
+h1 { text-align: center; }
+h2 { margin-top: 2em; }
+h3 { margin-top: 1.5em; }
+p { margin: 1em 0; }
+.footnotes {
+    margin-top: 3em;
+    font-size: 0.9em;
+}
+.footnote {
+    margin: 0.5em 0;
+}
+.chapter-notes {
+    margin-top: 3em;
+    padding-top: 1em;
+    border-top: 1px solid #ccc;
+}
+.note {
+    font-style: italic;
+    margin: 0.5em 0;
+}
+sup {
+    vertical-align: super;
+    font-size: 0.8em;
+}
+""".encode('utf-8')
+
+# Copy of the parser in LightNovelScraper.py; this script stays standalone instead of importing the full scraper
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP-date) to seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+def configure_logging(debug_mode: bool) -> None:
+    """Set up root logging once; repeated calls, e.g. from pool workers, leave it alone."""
+    if any(isinstance(handler, logging.FileHandler) for handler in logging.getLogger().handlers):
+        return
+    logging.basicConfig(
+        level=logging.DEBUG if debug_mode else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('scraper_detailed.log'),
+            logging.StreamHandler() if debug_mode else logging.NullHandler()
+        ]
+    )
+    if not debug_mode:
+        # httpx logs every request at INFO, keep per-request lines to debug runs
+        logging.getLogger('httpx').setLevel(logging.WARNING)
+
+def _is_ad(node) -> bool:
+    if node.tag in _AD_TAGS:
+        return True
+    attributes = node.attributes
+    if node.tag == 'div' and 'data-defid' in attributes:
+        return True
+    classes = attributes.get('class')
+    return bool(classes) and not _AD_CLASSES.isdisjoint(classes.split())
+
+def _iter_paragraphs(node):
+    """Yield paragraphs in document order, dropping ad elements in the same walk."""
+    for child in list(node.iter()):
+        if _is_ad(child):
+            child.decompose()
+        elif child.tag == 'p':
+            # Paragraphs cannot nest, this only strips ads inside the paragraph
+            yield from _iter_paragraphs(child)
+            yield child
+        else:
+            yield from _iter_paragraphs(child)
+
+def parse_chapter_html(text: str, url: str, cfg: Tuple[bool, bool, bool]) -> Tuple[Optional[str], Optional[str], Optional[List[str]], Optional[dict]]:
+    """Parse a chapter page; pure so it can run in a worker process."""
+    # Config arrives as a plain tuple, worker processes do not see changes made to the Config class
+    include_footnotes, include_chapter_notes, simple_chapter_names = cfg
+    logger = logging.getLogger(__name__)
+    
+    tree = LexborHTMLParser(text)
+    
+    # Find chapter title
+    chapter_title = None
+    title_elem = tree.css_first('span.chapter-title')
+    if title_elem:
+        if simple_chapter_names:
+            # Use only the chapter number from URL
+            url_match = _CHAPTER_NUM_RE.search(url)
+            if url_match:
+                chapter_num = url_match.group(1)
+                chapter_title = f"Chapter {chapter_num}"
+            else:
+                chapter_title = title_elem.text().strip()
+        else:
+            chapter_title = title_elem.text().strip()
+
+    if not chapter_title:
+        logger.warning("No chapter title found for %s", url)
+        return None, None, None, None
+    
+    # Find content
+    content_div = tree.css_first('div#chapter-container')
+    if not content_div:
+        logger.warning("No content container found for %s", url)
+        return None, None, None, None
+    
+    # Extract paragraphs, notes and footnotes
+    paragraphs = []
+    after_separator = []
+    footnotes = {}
+    found_first_separator = False
+    in_main_content = True
+    
+    # Ads are stripped while collecting paragraphs, in one walk over the container
+    for p in _iter_paragraphs(content_div):
+        # One text walk per paragraph; the HTML is only serialized for kept paragraphs
+        text = p.text().strip()
+        if not text:
+            continue
+        
+        # Check for separator
+        if text == '||':
+            if not found_first_separator:
+                found_first_separator = True
+            elif not (include_footnotes or include_chapter_notes):
+                # Nothing after the second separator would be kept
+                break
+            else:
+                in_main_content = False
+            continue
+        
+        if in_main_content:
+            # Add main content
+            paragraphs.append(p)
+        else:  # After || separator
+            # Check if it's a footnote
+            if '↩' in text and include_footnotes:
+                footnote_refs = p.css('sup')
+                for ref in footnote_refs:
+                    ref_num = ref.text().strip()
+                    if ref_num not in footnotes:  # Avoid duplicates
+                        footnotes[ref_num] = text
+            # If not a footnote and chapter notes are enabled, add to after_separator
+            elif include_chapter_notes:
+                after_separator.append(text)
+    if not paragraphs:
+        logger.warning("No valid paragraphs found for %s", url)
+        return None, None, None, None
+    
+    # Process main content to add footnote links if enabled
+    processed_paragraphs = []
+    for p in paragraphs:
+        for sup in p.css('sup'):
+            if not include_footnotes:
+                # Remove sup tags if footnotes are disabled, before the paragraph is serialized
+                sup.decompose()
+                continue
+            # Wrap referenced sups in place on the original tree
+            ref_num = sup.text().strip()
+            if ref_num in footnotes:
+                link = tree.create_node('a')
+                link.attrs['href'] = f'#footnote-{ref_num}'
+                link.insert_child(sup.clone())
+                sup.replace_with(link)
+        processed_paragraphs.append(p.html)
+    
+    # Join paragraphs with proper HTML
+    content = "\n".join(processed_paragraphs)
+    
+    return chapter_title, content, after_separator, footnotes
+
+def _render_footnotes(footnotes: dict) -> str:
+    items = ''.join(
+        f'<p id="footnote-{num}" class="footnote"><sup>{num}</sup> {text} <a href="#ref-{num}">↩</a></p>\n'
+        for num, text in footnotes.items()
+    )
+    return f'<div class="footnotes">\n<hr/>\n<h3>Footnotes</h3>\n{items}</div>\n'
+
+def _render_notes(notes: List[str]) -> str:
+    items = ''.join(f'<p class="note">{note}</p>\n' for note in notes)
+    return f'<div class="chapter-notes">\n<hr/>\n<h3>Chapter Notes</h3>\n{items}</div>\n'
+
+class RateLimiter:
+    def __init__(self, requests_per_second=2, burst=2):
+        self.rate = requests_per_second
+        self.capacity = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.paused_until = 0.0
+        
+    def pause(self, seconds: float):
+        """Hold back every request until the server's Retry-After has passed."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        
+    async def wait(self):
+        # Re-check after every sleep: a pause may start while queued, and waiters woken together must not share a token
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
 # Global Configuration
 class Config:
     INCLUDE_FOOTNOTES = False  # Toggle for footnotes in chapters
     INCLUDE_CHAPTER_NOTES = False  # Toggle for content after || separator
     SIMPLE_CHAPTER_NAMES = False  # Toggle for simplified chapter names (Chapter X)
+    USE_CACHE = True  # Toggle for the on-disk page cache
     DEBUG_MODE = False
 
-class RateLimiter:
-    def __init__(self, requests_per_second=2):
-        self.rate = requests_per_second
-        self.min_interval = 1.0 / requests_per_second
-        self.last_request_times = deque(maxlen=10)
-        
-    def wait(self):
-        now = datetime.now()
-        if self.last_request_times:
-            elapsed = (now - self.last_request_times[-1]).total_seconds()
-            if elapsed < self.min_interval:
-                sleep_time = max(0, self.min_interval - elapsed)
-                time.sleep(sleep_time)
-        self.last_request_times.append(now)
-
 class LightNovelScraper:
     def __init__(self, debug_mode=False):
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            # httpx decodes br only when the brotli package is installed
+            'Accept-Encoding': 'gzip, br'
         }
         self.base_url = "https://www.lightnovelworld.co/novel/"
-        self.rate_limiter = RateLimiter(requests_per_second=2)
+        self.rate_limiter = RateLimiter(requests_per_second=2, burst=2)
+        self.max_concurrency = 16
+        self.max_connections_per_host = 8
         self.debug_mode = debug_mode
         
-        logging.basicConfig(
-            level=logging.DEBUG if debug_mode else logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('scraper_detailed.log'),
-                logging.StreamHandler() if debug_mode else logging.NullHandler()
-            ]
-        )
         self.logger = logging.getLogger(__name__)
         
         self.consecutive_failures = 0
         self.max_retries = 3
+        self.max_missing_chapters = 3
         self.min_content_length = 100
+        self.cache_dir = '.lns_cache'
+        self.cache_expiry = 30 * 24 * 60 * 60
+
+    async def get_chapters(self, chapter_urls: Dict[int, str],
+                           on_chapter: Callable[[int, Tuple[Optional[str], Optional[str], Optional[List[str]], Optional[dict]]], None]) -> None:
+        # The rate limiter paces requests, the semaphore caps how many are in flight
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # HTTP/2 multiplexes the in-flight requests over a handful of connections
+        limits = httpx.Limits(max_connections=self.max_connections_per_host,
+                              max_keepalive_connections=self.max_connections_per_host)
+        cfg = (Config.INCLUDE_FOOTNOTES, Config.INCLUDE_CHAPTER_NOTES, Config.SIMPLE_CHAPTER_NAMES)
+        completed = 0
 
-    def get_chapter_content(self, url: str) -> Tuple[Optional[str], Optional[str], Optional[List[str]], Optional[dict]]:
+        with ProcessPoolExecutor(initializer=configure_logging, initargs=(self.debug_mode,)) as pool:
+            transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=self.max_retries)
+            async with httpx.AsyncClient(transport=transport, headers=self.headers, timeout=30,
+                                         follow_redirects=True) as client:
+                async def bounded_fetch(url):
+                    nonlocal completed
+                    async with semaphore:
+                        result = await self.get_chapter_content(client, pool, cfg, url)
+                    completed += 1
+                    print(f"\rProcessing: Chapter {completed}/{len(chapter_urls)}...", end="", flush=True)
+                    return result
+
+                tasks = {chapter_num: asyncio.ensure_future(bounded_fetch(url)) for chapter_num, url in chapter_urls.items()}
+                missing = 0
+                # Hand chapters over in reading order while later ones are still downloading
+                for chapter_num, task in tasks.items():
+                    chapter = await task
+                    on_chapter(chapter_num, chapter)
+                    
+                    missing = missing + 1 if chapter[3] == NOT_FOUND else 0
+                    if missing >= self.max_missing_chapters:
+                        # Past the last published chapter, do not spend requests on the rest of the range
+                        self.logger.info("%d consecutive chapters not found, stopping at chapter %d", missing, chapter_num)
+                        print(f"\nChapters {chapter_num - missing + 1}-{chapter_num} not found, stopping early.")
+                        for pending in tasks.values():
+                            pending.cancel()
+                        break
+
+    def _cache_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html.gz')
+
+    def _read_cache(self, url: str) -> Optional[str]:
+        if not Config.USE_CACHE:
+            return None
+        path = self._cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > self.cache_expiry:
+                return None
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, EOFError):
+            return None
+
+    def _drop_cache(self, url: str):
+        try:
+            os.remove(self._cache_path(url))
+        except OSError:
+            pass
+
+    def _write_cache(self, url: str, text: str):
+        if not Config.USE_CACHE:
+            return
+        path = self._cache_path(url)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write then rename so an interrupted run never leaves a truncated page behind
+            with gzip.open(path + '.tmp', 'wt', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            self.logger.warning("Could not cache %s: %s", url, e)
+
+    async def _fetch_page(self, client: httpx.AsyncClient, url: str) -> Optional[str]:
+        # Connect failures are retried by the transport and given up on here; this loop covers other transport errors,
+        # 429/5xx and empty pages
         for attempt in range(self.max_retries):
             try:
-                self.rate_limiter.wait()
+                await self.rate_limiter.wait()
                 
-                self.logger.info(f"Fetching URL: {url}")
-                response = requests.get(url, headers=self.headers, timeout=30)
+                self.logger.debug("Fetching URL: %s", url)
+                response = await client.get(url)
                 
                 response.raise_for_status()
+                body = response.text
                 
-                if not response.text.strip():
-                    self.logger.error(f"Empty response received for {url}")
+                if not body.strip():
+                    self.logger.error("Empty response received for %s", url)
                     raise ValueError("Empty response received from server")
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                return body
                 
-                # Find chapter title
-                chapter_title = None
-                title_elem = soup.find('span', class_='chapter-title')
-                if title_elem:
-                    if Config.SIMPLE_CHAPTER_NAMES:
-                        # Use only the chapter number from URL
-                        url_match = re.search(r'chapter-(\d+)', url)
-                        if url_match:
-                            chapter_num = url_match.group(1)
-                            chapter_title = f"Chapter {chapter_num}"
-                        else:
-                            chapter_title = title_elem.text.strip()
-                    else:
-                        chapter_title = title_elem.text.strip()
-
-                if not chapter_title:
-                    self.logger.warning(f"No chapter title found for {url}")
-                    return None, None, None, None
-                
-                # Find content
-                content_div = soup.find('div', id='chapter-container')
-                if not content_div:
-                    self.logger.warning(f"No content container found for {url}")
-                    return None, None, None, None
-                
-                # Clean up content
-                for element in content_div.select('script, ins, iframe, .adsbox, .ads, .ad-container, .aoyveLDZ, .vm-placement, div[data-defid]'):
-                    element.decompose()
-                
-                # Extract paragraphs, notes and footnotes
-                paragraphs = []
-                after_separator = []
-                footnotes = {}
-                found_first_separator = False
-                in_main_content = True
-                
-                for p in content_div.find_all('p'):
-                    text = p.text.strip()
-                    if text:
-                        # Check for separator
-                        if text == '||':
-                            if not found_first_separator:
-                                found_first_separator = True
-                                continue
-                            else:
-                                in_main_content = False
-                                continue
-                        
-                        if in_main_content:
-                            # Add main content
-                            paragraphs.append(str(p))
-                        else:  # After || separator
-                            # Check if it's a footnote
-                            if '↩' in text and Config.INCLUDE_FOOTNOTES:
-                                footnote_refs = p.find_all('sup')
-                                for ref in footnote_refs:
-                                    ref_num = ref.text.strip()
-                                    if ref_num not in footnotes:  # Avoid duplicates
-                                        footnotes[ref_num] = text
-                            # If not a footnote and chapter notes are enabled, add to after_separator
-                            elif Config.INCLUDE_CHAPTER_NOTES:
-                                after_separator.append(text)
-                if not paragraphs:
-                    self.logger.warning(f"No valid paragraphs found for {url}")
-                    return None, None, None, None
-                
-                # Process main content to add footnote links if enabled
-                processed_paragraphs = []
-                for p in paragraphs:
-                    if Config.INCLUDE_FOOTNOTES:
-                        soup_p = BeautifulSoup(p, 'html.parser')
-                        for sup in soup_p.find_all('sup'):
-                            ref_num = sup.text.strip()
-                            if ref_num in footnotes:
-                                sup.wrap(soup_p.new_tag('a', href=f'#footnote-{ref_num}'))
-                        processed_paragraphs.append(str(soup_p))
+            except (httpx.HTTPError, ValueError) as e:
+                self.logger.error("Error fetching %s: %s", url, e)
+                if isinstance(e, httpx.ConnectError):
+                    # The transport has already spent its retries on this connection
+                    return None
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 404:
+                    return NOT_FOUND
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code not in _RETRY_STATUSES:
+                    # Other permanent errors will not go away on retry either
+                    return None
+                if attempt < self.max_retries - 1:
+                    retry_after = None
+                    if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+                        retry_after = _parse_retry_after(e.response.headers.get('Retry-After'))
+                    if retry_after:
+                        # The whole client backs off, not just this task; rate_limiter.wait() sleeps out the pause
+                        self.rate_limiter.pause(retry_after)
                     else:
-                        # Remove sup tags if footnotes are disabled
-                        p_clean = re.sub(r'<sup>.*?</sup>', '', p)
-                        processed_paragraphs.append(p_clean)
-                
-                # Join paragraphs with proper HTML
-                content = "\n".join(processed_paragraphs)
-                
-                return chapter_title, content, after_separator, footnotes
-                
+                        # Exponential backoff with jitter
+                        await asyncio.sleep(min(60, 2 ** attempt + random.random()))
             except Exception as e:
-                self.logger.error(f"Error processing {url}: {str(e)}")
-                if attempt < self.max_retries - 1:
-                    time.sleep((attempt + 1) * 5)
-                else:
-                    return None, None, None, None
+                # Anything unexpected fails this chapter only, not the whole run
+                self.logger.error("Error fetching %s: %s", url, e)
+                return None
         
-        return None, None, None, None
+        return None
 
-    def create_epub(self, novel_title: str, chapters_data: List[Tuple[str, str, List[str], dict]]) -> Optional[epub.EpubBook]:
+    async def get_chapter_content(self, client: httpx.AsyncClient, pool: ProcessPoolExecutor,
+                                  cfg: Tuple[bool, bool, bool], url: str) -> Tuple[Optional[str], Optional[str], Optional[List[str]], Optional[dict]]:
+        # Raw pages are cached rather than parsed results, so re-runs with other flags still hit
+        body = self._read_cache(url)
+        cached = body is not None
+        if not cached:
+            body = await self._fetch_page(client, url)
+            if body is None or body is NOT_FOUND:
+                return None, None, None, body
+        
         try:
-            book = epub.EpubBook()
-            
-            book.set_identifier(f'id_{novel_title.lower().replace(" ", "_")}')
-            book.set_title(novel_title)
-            book.set_language('en')
-            book.add_author('LightNovelScraper')
-
-            chapters = []
-            chapter_entries = []
-
-            for idx, (chapter_title, content, after_separator, footnotes) in enumerate(chapters_data, 1):
-                chapter = epub.EpubHtml(
-                    title=chapter_title,
-                    file_name=f'chap_{idx:03d}.xhtml',
-                    lang='en'
-                )
-                
-                chapter_content = [
-                    f'<h1>{chapter_title}</h1>',
-                    '<div class="chapter-content">',
-                    content
-                ]
-                
-                # Add footnotes if enabled and present
-                if Config.INCLUDE_FOOTNOTES and footnotes:
-                    chapter_content.append('<div class="footnotes">')
-                    chapter_content.append('<hr/>')
-                    chapter_content.append('<h3>Footnotes</h3>')
-                    for num, text in footnotes.items():
-                        chapter_content.append(
-                            f'<p id="footnote-{num}" class="footnote">'
-                            f'<sup>{num}</sup> {text} '
-                            f'<a href="#ref-{num}">↩</a></p>'
-                        )
-                    chapter_content.append('</div>')
-                
-                # Only add chapter notes if explicitly enabled
-                if Config.INCLUDE_CHAPTER_NOTES and after_separator and len(after_separator) > 0:
-                    chapter_content.append('<div class="chapter-notes">')
-                    chapter_content.append('<hr/>')
-                    chapter_content.append('<h3>Chapter Notes</h3>')
-                    for note in after_separator:
-                        chapter_content.append(f'<p class="note">{note}</p>')
-                    chapter_content.append('</div>')
-                
-                chapter_content.append('</div>')
-                chapter.content = '\n'.join(chapter_content)
-                
-                book.add_item(chapter)
-                chapters.append(chapter)
-                chapter_entries.append(chapter)
+            # Parsing is CPU-bound, run it in the process pool so it does not stall the event loop
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(pool, parse_chapter_html, body, url, cfg)
+        except Exception as e:
+            # A page that fails to parse fails the same way on a refetch, so it is not retried
+            self.logger.error("Error processing %s: %s", url, e)
+            result = None, None, None, None
+        
+        # Only pages that yielded a chapter are kept, a challenge or placeholder page must not stick for 30 days
+        if result[0] and result[1]:
+            if not cached:
+                self._write_cache(url, body)
+        elif cached:
+            self._drop_cache(url)
+        return result
 
+    def create_epub(self, novel_title: str) -> epub.EpubBook:
+        book = epub.EpubBook()
+        
+        book.set_identifier(f'id_{novel_title.lower().replace(" ", "_")}')
+        book.set_title(novel_title)
+        book.set_language('en')
+        book.add_author('LightNovelScraper')
+        return book
+
+    def add_chapter(self, book: epub.EpubBook, idx: int, chapter_title: str, content: str,
+                    after_separator: List[str], footnotes: dict) -> epub.EpubHtml:
+        chapter = epub.EpubHtml(
+            title=chapter_title,
+            file_name=f'chap_{idx:03d}.xhtml',
+            lang='en'
+        )
+        
+        # Add footnotes and chapter notes only if enabled and present
+        footnotes_html = _render_footnotes(footnotes) if Config.INCLUDE_FOOTNOTES and footnotes else ''
+        notes_html = _render_notes(after_separator) if Config.INCLUDE_CHAPTER_NOTES and after_separator else ''
+        chapter.content = (f'<h1>{chapter_title}</h1>\n<div class="chapter-content">\n{content}\n'
+                           f'{footnotes_html}{notes_html}</div>')
+        
+        book.add_item(chapter)
+        return chapter
+
+    def finalize_epub(self, book: epub.EpubBook, novel_title: str, chapters: List[epub.EpubHtml]) -> Optional[epub.EpubBook]:
+        try:
             # Define Table of Contents
-            book.toc = ((epub.Section(novel_title), chapter_entries),)
+            book.toc = ((epub.Section(novel_title), chapters),)
 
             # Add navigation files
             book.add_item(epub.EpubNcx())
             book.add_item(epub.EpubNav())
 
-            # Define CSS
-            style = """
-                body { 
-                    font-family: Times New Roman, serif; 
-                    margin: 5%; 
-                    text-align: justify; 
-                }
-                h1 { text-align: center; }
-                h2 { margin-top: 2em; }
-                h3 { margin-top: 1.5em; }
-                p { margin: 1em 0; }
-                .footnotes {
-                    margin-top: 3em;
-                    font-size: 0.9em;
-                }
-                .footnote {
-                    margin: 0.5em 0;
-                }
-                .chapter-notes {
-                    margin-top: 3em;
-                    padding-top: 1em;
-                    border-top: 1px solid #ccc;
-                }
-                .note {
-                    font-style: italic;
-                    margin: 0.5em 0;
-                }
-                sup {
-                    vertical-align: super;
-                    font-size: 0.8em;
-                }
-            """
             nav_css = epub.EpubItem(
                 uid="style_nav",
                 file_name="style/nav.css",
                 media_type="text/css",
-                content=style
+                content=_NAV_CSS_BYTES
             )
             book.add_item(nav_css)
 
@@ -275,18 +466,20 @@ class LightNovelScraper:
             return book
 
         except Exception as e:
-            self.logger.error(f"Error creating EPUB: {str(e)}")
+            self.logger.error("Error creating EPUB: %s", e)
             return None
 
 def main():
     # Set debug mode
     Config.DEBUG_MODE = "--debug" in sys.argv
+    configure_logging(Config.DEBUG_MODE)
     scraper = LightNovelScraper(debug_mode=Config.DEBUG_MODE)
     
     # Allow command line arguments for footnotes and chapter notes
     Config.INCLUDE_FOOTNOTES = "--no-footnotes" not in sys.argv
     Config.INCLUDE_CHAPTER_NOTES = "--no-chapter-notes" not in sys.argv
     Config.SIMPLE_CHAPTER_NAMES = "--simple-chapters" in sys.argv
+    Config.USE_CACHE = "--no-cache" not in sys.argv
     
     try:
         print("Light Novel Scraper")
@@ -310,25 +503,23 @@ def main():
         if not novel_title:
             raise ValueError("Novel title cannot be empty")
         
-        chapters_data = []
-        successful_requests = 0
-        total_requests = 0
+        book = scraper.create_epub(novel_title)
+        chapters = []
         
-        for chapter_num in range(start_chapter, end_chapter + 1):
-            url = f"{scraper.base_url}{novel_id}/chapter-{chapter_num}"
-            print(f"\rProcessing: Chapter {chapter_num}/{end_chapter}...", end="", flush=True)
-            
-            chapter_title, content, after_separator, footnotes = scraper.get_chapter_content(url)
-            total_requests += 1
-            
+        def add_chapter(chapter_num, chapter):
+            chapter_title, content, after_separator, footnotes = chapter
             if chapter_title and content:
-                chapters_data.append((chapter_title, content, after_separator, footnotes))
-                successful_requests += 1
+                # Hand the chapter to the book right away instead of keeping every chapter's content around
+                chapters.append(scraper.add_chapter(book, len(chapters) + 1, chapter_title, content, after_separator, footnotes))
             else:
                 print(f"\nFailed: Chapter {chapter_num}")
         
-        if chapters_data:
-            book = scraper.create_epub(novel_title, chapters_data)
+        chapter_urls = {chapter_num: f"{scraper.base_url}{novel_id}/chapter-{chapter_num}"
+                        for chapter_num in range(start_chapter, end_chapter + 1)}
+        asyncio.run(scraper.get_chapters(chapter_urls, add_chapter))
+        
+        if chapters:
+            book = scraper.finalize_epub(book, novel_title, chapters)
             
             if book:
                 epub_filename = f"{novel_title.lower().replace(' ', '_')}.epub"
@@ -7,9 +7,16 @@ setup(
     packages=find_packages(),
     install_requires=[
         'requests>=2.31.0',
-        'beautifulsoup4>=4.12.0',
+        'beautifulsoup4>=4.13.0',
+        'lxml>=4.9.0',
+        'soupsieve>=2.0',
         'EbookLib>=0.18.0',
         'Pillow>=10.0.0',
+        'aiohttp>=3.8.0',
+        'aiolimiter>=1.1.0',
+        'selectolax>=0.4.6',
+        'httpx[http2]>=0.24.0',
+        'brotli>=1.0.9',
     ],
     entry_points={
         'console_scripts': [